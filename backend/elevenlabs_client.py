@@ -3,16 +3,69 @@
 import base64
 import json
 import asyncio
+import importlib.util
+import logging
+from collections import deque
 from dataclasses import dataclass
-from typing import Callable, Optional, Any
+from typing import Awaitable, Callable, Optional, Any, Union
 from urllib.parse import urlencode
 import httpx
+import msgspec
 import websockets
 
-@dataclass
+logger = logging.getLogger(f"rt.{__name__}")
+
+try:
+    # SIMD-accelerated (AVX2/SSSE3/NEON) base64, drop-in for the stdlib API
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # Fall back to stdlib on minimal deployments
+    _b64encode = base64.b64encode
+
+try:
+    # C-accelerated JSON for control messages
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _json_dumps = json.dumps
+
+
+# Typed schemas for the frequent server messages. Decoding straight into
+# these skips the intermediate dict, and the tag picks the handler.
+class _SessionStarted(msgspec.Struct, tag_field="message_type", tag="session_started"):
+    session_id: str = "unknown"
+
+    async def dispatch(self, client: "ElevenLabsRealtimeClient") -> None:
+        logger.info("Session started: %s", self.session_id)
+
+
+class _PartialTranscript(msgspec.Struct, tag_field="message_type", tag="partial_transcript"):
+    text: str = ""
+    transcript: str = ""
+
+    async def dispatch(self, client: "ElevenLabsRealtimeClient") -> None:
+        await client._emit(client.on_partial, self.transcript or self.text)
+
+
+class _CommittedTranscript(msgspec.Struct, tag_field="message_type", tag="committed_transcript"):
+    text: str = ""
+    transcript: str = ""
+
+    async def dispatch(self, client: "ElevenLabsRealtimeClient") -> None:
+        await client._emit(client.on_final, self.transcript or self.text)
+
+
+_server_message_decoder = msgspec.json.Decoder(
+    Union[_SessionStarted, _PartialTranscript, _CommittedTranscript]
+)
+
+
+@dataclass(frozen=True)
 class ElevenLabsConfig:
     """
     Configuration for an ElevenLabs realtime transcription session.
+    Immutable, so one instance can be shared by many sessions.
 
     - audio_format: e.g. "pcm_16000"
     - sample_rate: must match the actual audio content (8000-48000)
@@ -22,6 +75,8 @@ class ElevenLabsConfig:
     - model_id: Scribe realtime model ID
     - commit_strategy: "manual" or "vad"
     - vad_*: VAD-related settings used when commit_strategy = "vad"
+    - binary_audio: send raw PCM as binary WebSocket frames instead of
+      base64 JSON messages (only if the server side supports it)
     """
     audio_format: str = "pcm_16000"
     sample_rate: int = 16000
@@ -35,6 +90,8 @@ class ElevenLabsConfig:
     vad_threshold: Optional[float] = 0.4
     min_speech_duration_ms: Optional[int] = 250
 
+    binary_audio: bool = False
+
 
 class ElevenLabsRealtimeClient:
     """
@@ -46,17 +103,63 @@ class ElevenLabsRealtimeClient:
     - Supports both VAD and manual commit strategies
     """
 
+    # Shared by all clients so token fetches reuse pooled keep-alive connections
+    _http: Optional[httpx.AsyncClient] = None
+
     def __init__(self, api_key: str, config: ElevenLabsConfig):
         self.api_key = api_key
         self.config = config
 
-        self.on_partial: Optional[Callable[[str], None]] = None
-        self.on_final: Optional[Callable[[str], None]] = None
+        # Async callbacks, awaited on the dispatch task; inbound frames keep
+        # queueing in the inbox while a slow consumer is being awaited
+        self.on_partial: Optional[Callable[[str], Awaitable[None]]] = None
+        self.on_final: Optional[Callable[[str], Awaitable[None]]] = None
 
         self._ws: Any = None
         self._connected: bool = False
         self._last_chunk_had_audio: bool = False  # Track if we've sent audio since last commit
 
+        # Constant parts of the input_audio_chunk message, built in connect()
+        self._audio_prefix: bytes = b""
+        self._audio_suffix: bytes = b'"}'
+
+        # Reused frame buffer: the prefix is written once at connect, each
+        # send only overwrites the base64 body and suffix behind it
+        self._scratch = bytearray(16384)
+
+        self._send_lock = asyncio.Lock()
+
+        # Raw inbound frames; None marks the end of the stream
+        self._inbox: deque = deque()
+        self._inbox_waiter: Optional[asyncio.Future] = None
+
+        # Held so close() can cancel them; otherwise they outlive the client
+        self._recv_task: Optional[asyncio.Task] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def _get_http_client(cls) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it on first use.
+
+        HTTP/2 is enabled when the optional `h2` package is installed.
+        """
+        if cls._http is None or cls._http.is_closed:
+            cls._http = httpx.AsyncClient(
+                timeout=10.0,
+                http2=importlib.util.find_spec("h2") is not None,
+            )
+        return cls._http
+
+    @classmethod
+    async def aclose_http_client(cls) -> None:
+        """
+        Close the shared HTTP client (call once on application shutdown).
+        """
+        if cls._http is not None:
+            await cls._http.aclose()
+            cls._http = None
+
     async def _fetch_single_use_token(self) -> str:
         """
         Request a single-use token from ElevenLabs for realtime scribe.
@@ -74,10 +177,10 @@ class ElevenLabsRealtimeClient:
         url = "https://api.elevenlabs.io/v1/single-use-token/realtime_scribe"
         headers = {"xi-api-key": self.api_key}
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(url, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_http_client()
+        resp = await client.post(url, headers=headers)
+        resp.raise_for_status()
+        data = resp.json()
 
         token = data.get("token")
         if not token:
@@ -99,7 +202,7 @@ class ElevenLabsRealtimeClient:
         - Various exceptions if connection fails
         """
         if self._connected:
-            print("[ElevenLabsRealtimeClient] Already connected, skipping")
+            logger.debug("Already connected, skipping")
             return
 
         if not self.api_key:
@@ -108,9 +211,9 @@ class ElevenLabsRealtimeClient:
         # 1) Get single-use token
         try:
             token = await self._fetch_single_use_token()
-            print("[ElevenLabsRealtimeClient] Obtained single-use token")
+            logger.info("Obtained single-use token")
         except Exception as exc:
-            print(f"[ElevenLabsRealtimeClient] Failed to fetch token: {exc}")
+            logger.error("Failed to fetch token: %s", exc)
             raise
 
         # 2) Build WebSocket URL with all parameters
@@ -139,61 +242,96 @@ class ElevenLabsRealtimeClient:
                 params["min_speech_duration_ms"] = str(self.config.min_speech_duration_ms)
 
         url = f"{base_url}?{urlencode(params)}"
-        print(f"[ElevenLabsRealtimeClient] Connecting to {url[:100]}...")
+
+        # Pre-build the audio message around the base64 body so the hot path
+        # only splices bytes instead of building and serializing a dict.
+        # For manual strategy commits are sent separately; for VAD the server
+        # decides, so "commit" is always false here.
+        self._audio_prefix = (
+            b'{"message_type":"input_audio_chunk",'
+            b'"sample_rate":%d,'
+            b'"commit":false,'
+            b'"audio_base_64":"'
+        ) % int(self.config.sample_rate)
+        self._scratch[:len(self._audio_prefix)] = self._audio_prefix
+
+        logger.info("Connecting to %s...", url[:100])
 
         # 3) Connect to WebSocket
         try:
             self._ws = await websockets.connect(
                 url,
                 max_size=16 * 1024 * 1024,  # 16MB max message size
+                # base64 PCM barely compresses; permessage-deflate only costs CPU
+                compression=None,
             )
         except Exception as exc:
-            print(f"[ElevenLabsRealtimeClient] Failed to connect: {exc}")
+            logger.error("Failed to connect: %s", exc)
             self._connected = False
             self._ws = None
             raise
 
         self._connected = True
-        print("[ElevenLabsRealtimeClient] Connected successfully")
+        logger.info("Connected successfully")
 
-        # Start background receive loop
-        asyncio.create_task(self._receive_loop())
+        # Start background receive + dispatch loops
+        self._recv_task = asyncio.create_task(self._receive_loop())
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
 
-    async def send_audio_chunk(self, audio_bytes: bytes) -> None:
+    async def send_audio_chunk(self, audio_bytes: Union[bytes, memoryview]) -> None:
         """
         Send a chunk of audio to ElevenLabs.
 
         - Audio must be mono, PCM, sample rate given in config.
-        - Encoded as base64 and wrapped in a JSON message.
+        - Encoded as base64 and wrapped in a JSON message, or sent as a
+          raw binary frame when config.binary_audio is enabled.
         
         For manual commit strategy:
         - Audio chunks are sent with commit=False
         - Actual commits are triggered separately via send_commit()
         
         Args:
-        - audio_bytes: Raw PCM audio data (16-bit, mono, 16kHz recommended)
+        - audio_bytes: Raw PCM audio data (16-bit, mono, 16kHz recommended);
+          any bytes-like object, only read during the call
         """
         if not self._connected or self._ws is None:
-            print("[ElevenLabsRealtimeClient] Cannot send audio, not connected")
+            logger.warning("Cannot send audio, not connected")
             return
 
-        b64_audio = base64.b64encode(audio_bytes).decode("ascii")
+        async with self._send_lock:
+            await self._send_audio(audio_bytes)
 
-        # Build payload according to ElevenLabs API spec
-        payload = {
-            "message_type": "input_audio_chunk",
-            "audio_base_64": b64_audio,
-            "sample_rate": self.config.sample_rate,
-            # For manual strategy: always False, commit separately
-            # For VAD strategy: False, let server decide when to commit
-            "commit": False,
-        }
+    async def _send_audio(self, audio_bytes: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Send one audio message over the WebSocket.
 
+        Caller holds _send_lock, which also guards the scratch buffer.
+        """
         try:
-            await self._ws.send(json.dumps(payload))
+            if self.config.binary_audio:
+                # Raw PCM in a binary frame: no base64, no JSON, ~33% fewer bytes
+                await self._ws.send(audio_bytes)
+            else:
+                # base64 output is plain ASCII, safe inside a JSON string as-is,
+                # so the UTF-8 frame is assembled in the scratch buffer and
+                # sent as text without a str round-trip.
+                b64 = _b64encode(audio_bytes)
+                body_start = len(self._audio_prefix)
+                body_end = body_start + len(b64)
+                frame_end = body_end + len(self._audio_suffix)
+
+                scratch = self._scratch
+                if frame_end > len(scratch):
+                    scratch.extend(bytes(frame_end - len(scratch)))
+                scratch[body_start:body_end] = b64
+                scratch[body_end:frame_end] = self._audio_suffix
+
+                # websockets serializes the frame before send() returns
+                with memoryview(scratch)[:frame_end] as frame:
+                    await self._ws.send(frame, text=True)
             self._last_chunk_had_audio = True
         except Exception as exc:
-            print(f"[ElevenLabsRealtimeClient] Failed to send audio chunk: {exc}")
+            logger.error("Failed to send audio chunk: %s", exc)
             raise
 
     async def send_commit(self) -> None:
@@ -208,107 +346,210 @@ class ElevenLabsRealtimeClient:
         No-op if not connected or if commit strategy is VAD.
         """
         if not self._connected or self._ws is None:
-            print("[ElevenLabsRealtimeClient] Cannot send commit, not connected")
+            logger.warning("Cannot send commit, not connected")
             return
 
         if self.config.commit_strategy != "manual":
-            print("[ElevenLabsRealtimeClient] Commit signal only relevant for manual strategy")
+            logger.info("Commit signal only relevant for manual strategy")
             return
 
-        if not self._last_chunk_had_audio:
-            # No audio sent since last commit, skip
-            return
+        async with self._send_lock:
+            if not self._last_chunk_had_audio:
+                # No audio sent since last commit, skip
+                return
 
-        # Send empty audio chunk with commit=True
-        payload = {
-            "message_type": "input_audio_chunk",
-            "audio_base_64": "",  # Empty audio
-            "sample_rate": self.config.sample_rate,
-            "commit": True,
-        }
+            # Send empty audio chunk with commit=True
+            payload = {
+                "message_type": "input_audio_chunk",
+                "audio_base_64": _b64encode(b"").decode("ascii"),  # Empty audio
+                "sample_rate": self.config.sample_rate,
+                "commit": True,
+            }
 
-        try:
-            await self._ws.send(json.dumps(payload))
-            self._last_chunk_had_audio = False
-            print("[ElevenLabsRealtimeClient] Sent manual commit signal")
-        except Exception as exc:
-            print(f"[ElevenLabsRealtimeClient] Failed to send commit: {exc}")
-            raise
+            try:
+                await self._ws.send(_json_dumps(payload))
+                self._last_chunk_had_audio = False
+                logger.info("Sent manual commit signal")
+            except Exception as exc:
+                logger.error("Failed to send commit: %s", exc)
+                raise
 
     async def _receive_loop(self) -> None:
         """
         Background loop to receive messages from ElevenLabs.
 
-        Handles:
-        - session_started / sessionStarted
-        - partial_transcript / partialTranscript
-        - committed_transcript / committedTranscript / committedTranscriptWithTimestamps
-        - error messages
-        
-        Calls registered callbacks (on_partial / on_final) when transcripts arrive.
+        Only reads frames off the socket and queues them in the inbox;
+        _dispatch_loop parses them. Frames that arrive in a burst are queued
+        back to back and cost a single wakeup of the dispatcher.
         """
         if self._ws is None:
             return
 
         try:
             async for raw in self._ws:
-                try:
-                    msg = json.loads(raw)
-                except Exception as exc:
-                    print(f"[ElevenLabsRealtimeClient] Failed to parse message: {exc}")
-                    continue
-
-                msg_type = msg.get("message_type") or msg.get("type")
-
-                if msg_type in ("session_started", "sessionStarted"):
-                    session_id = msg.get("session_id", "unknown")
-                    print(f"[ElevenLabsRealtimeClient] Session started: {session_id}")
-
-                elif msg_type in ("partial_transcript", "partialTranscript"):
-                    text = msg.get("transcript") or msg.get("text") or ""
-                    if text and self.on_partial:
-                        self.on_partial(text)
-
-                elif msg_type in (
-                    "committed_transcript",
-                    "committedTranscript",
-                    "committedTranscriptWithTimestamps",
-                ):
-                    text = msg.get("transcript") or msg.get("text") or ""
-                    if text and self.on_final:
-                        self.on_final(text)
-
-                elif msg_type and "error" in msg_type.lower():
-                    error_msg = msg.get("message", msg.get("error", str(msg)))
-                    print(f"[ElevenLabsRealtimeClient] Error from server: {error_msg}")
-
-                else:
-                    # Unknown message type, log for debugging
-                    print(f"[ElevenLabsRealtimeClient] Unknown message type: {msg_type}")
+                self._inbox.append(raw)
+                self._wake_dispatcher()
 
         except asyncio.CancelledError:
-            print("[ElevenLabsRealtimeClient] Receive loop cancelled")
+            logger.info("Receive loop cancelled")
             raise
         except Exception as exc:
-            print(f"[ElevenLabsRealtimeClient] Receive loop error: {exc}")
+            logger.error("Receive loop error: %s", exc)
             self._connected = False
+        finally:
+            self._inbox.append(None)
+            self._wake_dispatcher()
+
+    def _wake_dispatcher(self) -> None:
+        waiter = self._inbox_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def _dispatch_loop(self) -> None:
+        """
+        Background loop that drains the inbox filled by _receive_loop.
+
+        Sleeps on a single Future while the inbox is empty, then handles
+        every queued message before waiting again.
+        """
+        loop = asyncio.get_running_loop()
+        inbox = self._inbox
+
+        while True:
+            if not inbox:
+                self._inbox_waiter = loop.create_future()
+                try:
+                    await self._inbox_waiter
+                finally:
+                    self._inbox_waiter = None
+
+            while inbox:
+                raw = inbox.popleft()
+                if raw is None:
+                    return
+                # One bad frame must not stop transcription for the session
+                try:
+                    await self._handle_message(raw)
+                except Exception:
+                    logger.exception("Failed to handle message")
+
+    async def _handle_message(self, raw: Any) -> None:
+        """
+        Parse and dispatch one message from ElevenLabs.
+
+        Session start and transcript messages decode straight into typed
+        Structs that dispatch themselves. Anything else (camelCase aliases,
+        errors, unknown types) falls back to a generic decode and a lookup
+        in _HANDLERS, which maps every known alias to its handler.
+        Awaits the registered callbacks (on_partial / on_final) when
+        transcripts arrive; they run on the dispatch task, in arrival order.
+        """
+        try:
+            msg = _server_message_decoder.decode(raw)
+        except msgspec.ValidationError:
+            pass
+        except msgspec.DecodeError as exc:
+            logger.error("Failed to parse message: %s", exc)
+            return
+        else:
+            await msg.dispatch(self)
+            return
+
+        try:
+            msg = msgspec.json.decode(raw)
+        except msgspec.DecodeError as exc:
+            logger.error("Failed to parse message: %s", exc)
+            return
+
+        if not isinstance(msg, dict):
+            logger.warning("Ignoring non-object message: %.200r", raw)
+            return
+
+        msg_type = msg.get("message_type") or msg.get("type")
+        if not isinstance(msg_type, str):
+            logger.debug("Message without a string type: %s", msg_type)
+            return
+
+        handler = self._HANDLERS.get(msg_type)
+        if handler is not None:
+            await handler(self, msg)
+        elif msg_type and "error" in msg_type.lower():
+            # Error types not listed in _HANDLERS
+            await self._on_error(msg)
+        else:
+            # Unknown message type, log for debugging
+            logger.debug("Unknown message type: %s", msg_type)
+
+    async def _on_session_started(self, msg: dict) -> None:
+        session_id = msg.get("session_id", "unknown")
+        logger.info("Session started: %s", session_id)
+
+    async def _on_partial_transcript(self, msg: dict) -> None:
+        await self._emit(self.on_partial, msg.get("transcript") or msg.get("text") or "")
+
+    async def _on_committed_transcript(self, msg: dict) -> None:
+        await self._emit(self.on_final, msg.get("transcript") or msg.get("text") or "")
+
+    async def _emit(self, callback: Optional[Callable[[str], Awaitable[None]]], text: str) -> None:
+        # Awaited inline: a failing callback must not stop the dispatch loop
+        if text and callback:
+            try:
+                await callback(text)
+            except Exception as exc:
+                logger.error("Transcript callback failed: %s", exc)
+
+    async def _on_error(self, msg: dict) -> None:
+        error_msg = msg.get("message", msg.get("error", str(msg)))
+        logger.error("Error from server: %s", error_msg)
+
+    # Server message type (all known aliases) -> handler
+    _HANDLERS: dict[str, Callable[["ElevenLabsRealtimeClient", dict], Awaitable[None]]] = {
+        "session_started": _on_session_started,
+        "sessionStarted": _on_session_started,
+        "partial_transcript": _on_partial_transcript,
+        "partialTranscript": _on_partial_transcript,
+        "committed_transcript": _on_committed_transcript,
+        "committedTranscript": _on_committed_transcript,
+        "committedTranscriptWithTimestamps": _on_committed_transcript,
+        "error": _on_error,
+        "auth_error": _on_error,
+        "quota_exceeded": _on_error,
+        "commit_throttled": _on_error,
+        "transcriber_error": _on_error,
+        "unaccepted_terms": _on_error,
+        "rate_limited": _on_error,
+        "input_error": _on_error,
+        "queue_overflow": _on_error,
+        "resource_exhausted": _on_error,
+        "session_time_limit_exceeded": _on_error,
+        "chunk_size_exceeded": _on_error,
+        "insufficient_audio_activity": _on_error,
+    }
 
     async def close(self) -> None:
         """
         Close the connection to ElevenLabs and clean up resources.
         
         - Closes WebSocket connection gracefully
+        - Cancels and awaits the receive / dispatch loops
         - Marks client as disconnected
         - Safe to call multiple times
         """
         if self._ws is not None:
             try:
                 await self._ws.close()
-                print("[ElevenLabsRealtimeClient] WebSocket closed")
+                logger.info("WebSocket closed")
             except Exception as exc:
-                print(f"[ElevenLabsRealtimeClient] Error while closing: {exc}")
+                logger.warning("Error while closing: %s", exc)
             finally:
                 self._ws = None
-                
+
+        tasks = [t for t in (self._recv_task, self._dispatch_task) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._recv_task = None
+        self._dispatch_task = None
+
         self._connected = False
-        print("[ElevenLabsRealtimeClient] Client disconnected")
\ No newline at end of file
+        logger.info("Client disconnected")
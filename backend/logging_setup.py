@@ -0,0 +1,49 @@
+# backend/logging_setup.py
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class _UnformattedQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records as they are.
+
+    The stock prepare() formats the message on the logging thread (the
+    event loop) so the record can be pickled; records never leave this
+    process, so formatting is left to the listener's handlers instead.
+    Arguments are therefore rendered later: don't log objects that are
+    mutated right after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(level: int | str = logging.INFO) -> QueueListener:
+    """
+    Configure the "rt" logger hierarchy used by the backend modules.
+
+    Purpose:
+    - Hot paths (audio chunks, transcripts) only put the unformatted
+      record on a queue.
+    - Message formatting and writing to stderr happen on the listener's
+      background thread, so logging never blocks the event loop.
+
+    Returns:
+    - The started QueueListener; call .stop() on shutdown to flush it.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+
+    logger = logging.getLogger("rt")
+    logger.setLevel(level)
+    logger.addHandler(_UnformattedQueueHandler(log_queue))
+    logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -1,9 +1,14 @@
 # backend/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends
 from session_manager import SessionManager
+from elevenlabs_client import ElevenLabsRealtimeClient
 from run_logger import RunLogger
+from logging_setup import setup_logging
 from pathlib import Path
+import logging
 import os
+import socket
 from dotenv import load_dotenv
 
 # Load .env from project root (one level up from backend/)
@@ -11,7 +16,36 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 ENV_PATH = ROOT_DIR / ".env"
 load_dotenv(ENV_PATH)  # This will load ELEVENLABS_API_KEY into environment
 
-app = FastAPI()
+# Logging goes through a queue drained on a background thread (LOG_LEVEL=DEBUG
+# shows per-chunk and per-transcript lines).
+log_listener = setup_logging(os.getenv("LOG_LEVEL", "INFO").upper())
+logger = logging.getLogger(f"rt.{__name__}")
+
+# uvloop (libuv-based event loop) is used when available; every session
+# handler is a coroutine, so lower per-await overhead benefits all of them.
+# The loop is chosen through uvicorn's `loop` setting, see __main__ below
+# (`uvicorn main:app` picks uvloop on its own with its default "auto").
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    App lifecycle hook.
+
+    - Shutdown: release shared clients, drain the run logger and flush
+      queued log records.
+    """
+    yield
+    await ElevenLabsRealtimeClient.aclose_http_client()
+    run_logger.close()
+    log_listener.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Create a single, shared SessionManager instance for the whole app.
 # In a more advanced setup you could use dependency injection with lifespans,
@@ -90,5 +124,34 @@ async def websocket_endpoint(
         await manager.close_session(session_id)
     except Exception as exc:
         # Any unexpected error: log it and close the session.
-        print(f"Unexpected error in WebSocket endpoint: {exc}")
-        await manager.close_session(session_id)
\ No newline at end of file
+        logger.error("Unexpected error in WebSocket endpoint: %s", exc)
+        await manager.close_session(session_id)
+
+
+def _listen_socket(host: str, port: int) -> socket.socket:
+    """
+    Bind the server socket ourselves and hand it to uvicorn.
+
+    Buffer sizes are left to the kernel: an explicit SO_SNDBUF would turn
+    off Linux send-buffer autotuning for every accepted connection.
+    TCP_NODELAY is already set on every accepted socket by the event loop.
+    """
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+
+if __name__ == "__main__":
+    # `python main.py` entrypoint; pins uvicorn to uvloop when installed
+    # instead of relying on its "auto" loop detection.
+    import uvicorn
+
+    config = uvicorn.Config(
+        app,
+        loop="uvloop" if uvloop is not None else "asyncio",
+        backlog=4096,
+    )
+    sock = _listen_socket(os.getenv("HOST", "127.0.0.1"), int(os.getenv("PORT", "8000")))
+    uvicorn.Server(config).run(sockets=[sock])
@@ -1,26 +1,141 @@
 # backend/run_logger.py
+import logging
+import queue
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, Iterator, Union
+
+import msgspec
+
+logger = logging.getLogger(f"rt.{__name__}")
+
+
+class AudioChunksEvent(msgspec.Struct, tag_field="type", tag="audio_chunks"):
+    """
+    A batch of audio chunks forwarded to ElevenLabs.
+
+    t0 is the time.monotonic() of the first chunk, offsets are seconds
+    relative to it and sizes are in bytes (one entry per chunk).
+    """
+    t0: float
+    offsets: list[float]
+    sizes: list[int]
+
+
+class TranscriptEvent(msgspec.Struct, tag_field="type", tag="transcript"):
+    """One partial / final transcript pushed to the frontend."""
+    is_final: bool
+    text: str
+
+
+# Hot-path events use the Structs above; rare events stay plain dicts
+Event = Union[Dict[str, Any], msgspec.Struct]
 
 
 class RunLogger:
     """
-    Minimal stub implementation for now.
+    Persists session events for later analysis.
+
+    Storage format:
+    - One file per session: <base_dir>/<session_id>.mpk
+    - Each record is a 4-byte big-endian length followed by a MsgPack
+      encoded event (see iter_run_events() to read a file back).
 
-    Purpose:
-    - Avoid import errors.
-    - Provide simple print-based logging.
+    Threading:
+    - start_run / log_event / finish_run only put work on a queue, so they
+      never block the event loop on file I/O.
+    - A background thread encodes and writes the records in order; call
+      close() on shutdown to drain it.
+    - Events are encoded on the writer thread, so callers must not mutate
+      an event after logging it.
     """
 
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+        # Everything below is only touched by the writer thread
+        self._files: Dict[str, BinaryIO] = {}
+        self._encoder = msgspec.msgpack.Encoder()
+        # Reused record buffer: length header followed by the payload
+        self._record = bytearray(4)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, name="run-logger", daemon=True)
+        self._writer.start()
+
+    def _write_loop(self) -> None:
+        while (item := self._queue.get()) is not None:
+            func, *args = item
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Run logger write failed")
+
+        for fp in self._files.values():
+            fp.close()
+        self._files.clear()
+
+    def _write(self, fp: BinaryIO, event: Event) -> None:
+        record = self._record
+        self._encoder.encode_into(event, record, 4)
+        record[:4] = (len(record) - 4).to_bytes(4, "big")
+        fp.write(record)
+
+    def _open_run(self, session_id: str, meta: Dict[str, Any]) -> None:
+        # Large write buffer: records are small and mostly hit memory only
+        fp = open(self.base_dir / f"{session_id}.mpk", "ab", buffering=1 << 16)
+        self._files[session_id] = fp
+        self._write(fp, {"type": "run_started", "meta": meta})
+
+    def _write_event(self, session_id: str, event: Event) -> None:
+        fp = self._files.get(session_id)
+        if fp is None:
+            return
+        self._write(fp, event)
+
+    def _close_run(self, session_id: str) -> None:
+        fp = self._files.pop(session_id, None)
+        if fp is None:
+            return
+        self._write(fp, {"type": "run_finished"})
+        fp.close()
+
     def start_run(self, session_id: str, meta: Dict[str, Any] | None = None) -> None:
-        print(f"[RunLogger] Start run for session {session_id}, meta={meta}")
+        logger.info("Start run for session %s, meta=%s", session_id, meta)
+        self._queue.put((self._open_run, session_id, meta or {}))
 
-    def log_event(self, session_id: str, event: Dict[str, Any]) -> None:
-        print(f"[RunLogger] Event for {session_id}: {event}")
+    def log_event(self, session_id: str, event: Event) -> None:
+        logger.debug("Event for %s: %s", session_id, event)
+        self._queue.put((self._write_event, session_id, event))
 
     def finish_run(self, session_id: str) -> None:
-        print(f"[RunLogger] Finish run for session {session_id}")
\ No newline at end of file
+        logger.info("Finish run for session %s", session_id)
+        self._queue.put((self._close_run, session_id))
+
+    def close(self) -> None:
+        """
+        Write everything still queued, close open run files and stop the
+        writer thread. Safe to call multiple times.
+        """
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+
+def iter_run_events(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read back the events of one run file written by RunLogger.
+
+    A truncated last record (the process died mid-write) is skipped with a
+    warning; every complete record before it is still returned.
+    """
+    decoder = msgspec.msgpack.Decoder()
+    with open(path, "rb") as fp:
+        while header := fp.read(4):
+            size = int.from_bytes(header, "big")
+            payload = fp.read(size)
+            if len(header) < 4 or len(payload) < size:
+                logger.warning("Truncated last record in %s", path)
+                return
+            yield decoder.decode(payload)
@@ -1,33 +1,234 @@
 import asyncio
+import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, Optional
 from fastapi import WebSocket
-from uuid import uuid4
+from fastapi.websockets import WebSocketState
+import numpy as np
 
-from run_logger import RunLogger
+from run_logger import AudioChunksEvent, RunLogger, TranscriptEvent
 from elevenlabs_client import ElevenLabsRealtimeClient, ElevenLabsConfig
 import os
+import sys
+import time
+
+try:
+    import numba
+except ImportError:  # Resampling falls back to numpy
+    numba = None
+
+logger = logging.getLogger(f"rt.{__name__}")
+
+# ElevenLabs settings per mode; there are only two, so every session of
+# a mode shares one (frozen) config instance
+_DISCUSSION_CONFIG = ElevenLabsConfig(
+    audio_format="pcm_16000",
+    sample_rate=16000,
+    language_code=None,
+    timestamps_granularity="word",
+    mode="discussion",
+    # Discussion mode uses manual commit with optimal 12s interval
+    commit_strategy="manual",
+    # Manual strategy doesn't use VAD parameters
+    vad_silence_threshold_secs=None,
+    vad_threshold=None,
+    min_speech_duration_ms=None,
+)
+_LECTURE_CONFIG = ElevenLabsConfig(
+    audio_format="pcm_16000",
+    sample_rate=16000,
+    language_code=None,
+    timestamps_granularity="word",
+    mode="lecture",
+    # Lecture mode uses VAD for natural pause detection
+    commit_strategy="vad",
+    vad_silence_threshold_secs=1.5,  # Treat 1.5s silence as end of segment
+    vad_threshold=0.4,               # Voice activity detection threshold
+    min_speech_duration_ms=250,      # Minimum speech duration
+)
+
+# Manual commit interval, optimal for presentations (from Experiment C)
+_MANUAL_COMMIT_INTERVAL_SECS = 12.0
+
+# Wire prefix of transcript messages to the frontend, indexed by is_final
+_TRANSCRIPT_PREFIXES = ("[partial] ", "[final] ")
+
+# Fixed control replies, formatted once instead of per message. They go
+# out through send_text(), which builds a fresh ASGI message per send: a
+# shared pre-built message dict could be mutated in place by middleware or
+# the server, and replies are too rare for the saved dict to matter.
+_MODES = ("lecture", "discussion")
+_MODE_CONNECTED_REPLIES = {m: f"[config] mode set to {m}, connected to ElevenLabs" for m in _MODES}
+_MODE_ALREADY_SET_REPLIES = {m: f"[config] mode already set to {m}" for m in _MODES}
+_NO_API_KEY_REPLY = "[error] ELEVENLABS_API_KEY not configured"
+_STOP_REPLY = "[info] Recording stopped"
+
+# Audio chunks are logged in batches of this many chunks, or once the
+# oldest buffered chunk is this many seconds old
+_AUDIO_LOG_BATCH = 64
+_AUDIO_LOG_MAX_AGE_SECS = 1.0
+
+# Transcripts waiting to be sent to a slow frontend; beyond this the
+# oldest pending partial is dropped (finals are never dropped)
+_OUTBOX_MAX_PENDING = 32
+# How long close_session waits for queued finals to reach the frontend
+_OUTBOX_CLOSE_TIMEOUT_SECS = 2.0
+
+
+@dataclass(slots=True)
+class ResampleState:
+    """
+    Resampler state carried from one audio chunk to the next.
+
+    - phase: Input position of the next output sample relative to the first
+      sample of the next chunk, in units of 1/dst_sr input samples (exact
+      integer arithmetic, so chunking cannot accumulate rounding drift).
+    - last: Last input sample of the previous chunk.
+    - carry: Odd trailing byte of the previous chunk, prepended to the next.
+    """
+    phase: int = 0
+    last: int = 0
+    carry: bytes = b""
 
 
-@dataclass
+def _resample_kernel(
+    samples: np.ndarray, start: int, src_sr: int, dst_sr: int, n_out: int
+) -> np.ndarray:
+    """
+    Linear-interpolation resampler over int16 samples (compiled by numba).
+
+    Output i is samples interpolated at (start + i * src_sr) / dst_sr; the
+    caller makes sure every such position has a right-hand neighbour.
+    """
+    out = np.empty(n_out, dtype=np.int16)
+
+    for i in range(n_out):
+        num = start + i * src_sr
+        j = num // dst_sr
+        frac = (num - j * dst_sr) / dst_sr
+        a = float(samples[j])
+        b = float(samples[j + 1])
+        v = np.rint(a + (b - a) * frac)
+        if v > 32767.0:
+            v = 32767.0
+        elif v < -32768.0:
+            v = -32768.0
+        out[i] = np.int16(v)
+
+    return out
+
+
+def _resample_numpy(
+    samples: np.ndarray, start: int, src_sr: int, dst_sr: int, n_out: int
+) -> np.ndarray:
+    """
+    Same as _resample_kernel, vectorized with numpy (used without numba).
+    """
+    num = start + np.arange(n_out, dtype=np.int64) * src_sr
+    j = num // dst_sr
+    frac = (num - j * dst_sr) / dst_sr
+    a = samples[j].astype(np.float64)
+    b = samples[j + 1].astype(np.float64)
+    return np.clip(np.rint(a + (b - a) * frac), -32768, 32767).astype(np.int16)
+
+
+if numba is not None:
+    _resample = numba.njit(cache=True)(_resample_kernel)
+    # Compile (or load from cache) now rather than on the first resampled
+    # chunk, which would stall the event loop mid-session
+    _resample(np.zeros(2, dtype=np.int16), 0, 1, 1, 1)
+else:
+    _resample = _resample_numpy
+
+
+def _prepare_pcm(
+    data: memoryview, src_sr: int, dst_sr: int, state: ResampleState
+) -> bytes | memoryview:
+    """
+    Convert a chunk of 16-bit mono PCM from src_sr to dst_sr.
+
+    Chunks are treated as one continuous stream: an odd trailing byte and
+    the resampler phase are kept in state and carried into the next call,
+    so chunking neither drifts the timing nor misaligns samples.
+    Returns the input unchanged when the rates already match and no byte
+    is carried (the normal case for the macOS app, which captures at 16 kHz).
+    """
+    if state.carry:
+        data = state.carry + data
+        state.carry = b""
+    if len(data) % 2:
+        state.carry = bytes(data[-1:])
+        data = data[:-1]
+
+    if src_sr == dst_sr:
+        return data
+
+    samples = np.frombuffer(data, dtype=np.int16)
+    n_in = samples.shape[0]
+    if n_in == 0:
+        return b""
+
+    # Prepend the previous chunk's last sample so positions between the
+    # two chunks interpolate across the boundary
+    ext = np.empty(n_in + 1, dtype=np.int16)
+    ext[0] = state.last
+    ext[1:] = samples
+
+    # Positions on ext, in units of 1/dst_sr samples; the last usable one
+    # must be left of ext[n_in]
+    start = state.phase + dst_sr
+    n_out = max(0, -(-(n_in * dst_sr - start) // src_sr))
+    out = _resample(ext, start, src_sr, dst_sr, n_out)
+
+    state.phase = start + n_out * src_sr - n_in * dst_sr - dst_sr
+    state.last = int(samples[-1])
+    return out.tobytes()
+
+
+@dataclass(slots=True)
 class Session:
     """
     Represents the state of a WebSocket transcription session.
 
     Fields:
-    - id: Unique session ID (e.g., a UUID string).
+    - id: Unique session ID (random 128-bit hex string).
     - websocket: The WebSocket connection to the frontend client.
     - eleven_client: Client that talks to ElevenLabs Realtime.
     - is_active: Whether this session is still active.
-    - meta: Arbitrary metadata (mode, language, start time, errors, etc.).
-    - manual_commit_task: Background task for manual commit strategy.
+    - mode: "lecture" or "discussion" once MODE: has been received.
+    - connection_error: Last ElevenLabs connection error, if any.
+    - started_at: time.monotonic() at session creation.
+    - meta: Any other, free-form metadata (None until something needs it).
+    - input_sample_rate: Sample rate of the PCM the frontend sends
+      (resampled to the ElevenLabs config rate if it differs).
+    - resample_state: Resampler phase / odd byte carried across chunks.
+    - audio_log_buf: (monotonic time, size) of chunks not yet written
+      to the RunLogger.
+    - send_text / log_event: websocket.send_text and run_logger.log_event
+      bound once at creation for the per-chunk / per-transcript paths
+      (log_event is None without a RunLogger).
+    - outbox: (is_final, text) transcripts not yet sent to the frontend,
+      drained in order by outbox_task; outbox_waiter wakes it up.
+    - commit_task: In-flight manual commit sent by the commit sweep.
     """
     id: str
     websocket: WebSocket
     eleven_client: Optional[ElevenLabsRealtimeClient] = None
     is_active: bool = True
-    meta: Dict[str, Any] = field(default_factory=dict)
-    manual_commit_task: Optional[asyncio.Task] = None
+    mode: Optional[str] = None
+    connection_error: Optional[str] = None
+    started_at: float = 0.0
+    meta: Optional[Dict[str, Any]] = None
+    input_sample_rate: int = 16000
+    resample_state: ResampleState = field(default_factory=ResampleState)
+    audio_log_buf: list[tuple[float, int]] = field(default_factory=list)
+    send_text: Optional[Callable[[str], Awaitable[None]]] = None
+    log_event: Optional[Callable[[str, Any], None]] = None
+    outbox: deque = field(default_factory=deque)
+    outbox_waiter: Optional[asyncio.Future] = None
+    outbox_task: Optional[asyncio.Task] = None
+    commit_task: Optional[asyncio.Task] = None
 
 
 class SessionManager:
@@ -53,9 +254,12 @@ class SessionManager:
         self.run_logger = run_logger
         self._api_key = api_key or os.getenv("ELEVENLABS_API_KEY", "")
 
+        # Pending shared manual commit sweep for all discussion sessions
+        self._commit_timer: Optional[asyncio.TimerHandle] = None
+
     def _build_elevenlabs_config_for_mode(self, mode: str) -> ElevenLabsConfig:
         """
-        Build an ElevenLabsConfig for the given mode.
+        Return the shared ElevenLabsConfig for the given mode.
 
         Modes:
         - lecture: VAD commit strategy, optimal for long monologues
@@ -66,35 +270,7 @@ class SessionManager:
         - 12s: Presentation mode (best for structured speech)
         - 20s: Lecture mode (continuous professor lectures)
         """
-        mode = mode.lower()
-        
-        if mode == "discussion":
-            # Discussion mode uses manual commit with optimal 12s interval
-            return ElevenLabsConfig(
-                audio_format="pcm_16000",
-                sample_rate=16000,
-                language_code=None,
-                timestamps_granularity="word",
-                mode=mode,
-                commit_strategy="manual",
-                # Manual strategy doesn't use VAD parameters
-                vad_silence_threshold_secs=None,
-                vad_threshold=None,
-                min_speech_duration_ms=None,
-            )
-        else:
-            # Lecture mode uses VAD for natural pause detection
-            return ElevenLabsConfig(
-                audio_format="pcm_16000",
-                sample_rate=16000,
-                language_code=None,
-                timestamps_granularity="word",
-                mode="lecture",
-                commit_strategy="vad",
-                vad_silence_threshold_secs=1.5,  # Treat 1.5s silence as end of segment
-                vad_threshold=0.4,               # Voice activity detection threshold
-                min_speech_duration_ms=250,      # Minimum speech duration
-            )
+        return _DISCUSSION_CONFIG if mode.lower() == "discussion" else _LECTURE_CONFIG
 
     async def create_session(self, websocket: WebSocket) -> Session:
         """
@@ -104,14 +280,23 @@ class SessionManager:
         - ElevenLabs client will be created lazily when MODE is received.
         - This allows users to connect without immediately consuming resources.
         """
-        session_id = str(uuid4())
-        session = Session(id=session_id, websocket=websocket)
+        # Same 128 bits of randomness as uuid4, without building a UUID object.
+        # Interned so dict lookups with the id the endpoint keeps (session.id)
+        # short-circuit on identity.
+        session_id = sys.intern(os.urandom(16).hex())
+        session = Session(
+            id=session_id,
+            websocket=websocket,
+            started_at=time.monotonic(),
+            send_text=websocket.send_text,
+            log_event=self.run_logger.log_event if self.run_logger is not None else None,
+        )
         self.sessions[session_id] = session
 
         if self.run_logger is not None:
             self.run_logger.start_run(session_id, meta={"status": "created"})
 
-        print(f"[SessionManager] Created session {session_id}")
+        logger.info("Created session %s", session_id)
         return session
 
     async def close_session(self, session_id: str) -> None:
@@ -120,57 +305,87 @@ class SessionManager:
 
         Steps:
         1. Mark session as inactive
-        2. Cancel manual commit task if running
-        3. Close ElevenLabs client connection
+        2. Cancel an in-flight manual commit, close ElevenLabs client connection
+        3. Send the finals still in the transcript outbox (unless the
+           frontend is already gone), stop the outbox
         4. Close WebSocket (if not already closed by client)
         5. Notify RunLogger
         6. Remove from sessions dictionary
         """
         session = self.sessions.get(session_id)
         if not session:
-            print(f"[SessionManager] Session {session_id} not found, already closed?")
+            logger.warning("Session %s not found, already closed?", session_id)
             return
 
         session.is_active = False
-        print(f"[SessionManager] Closing session {session_id}")
+        logger.info(
+            "Closing session %s after %.1fs", session_id, time.monotonic() - session.started_at
+        )
 
-        # Cancel manual commit task if running
-        if session.manual_commit_task is not None:
-            session.manual_commit_task.cancel()
-            try:
-                await session.manual_commit_task
-            except asyncio.CancelledError:
-                pass
-            print(f"[SessionManager] Cancelled manual commit task for {session_id}")
+        # Stop an in-flight manual commit; close() flushes the audio itself
+        if session.commit_task is not None:
+            session.commit_task.cancel()
+            await asyncio.gather(session.commit_task, return_exceptions=True)
+            session.commit_task = None
 
         # Close ElevenLabs client
         if session.eleven_client is not None:
             try:
                 await session.eleven_client.close()
-                print(f"[SessionManager] Closed ElevenLabs client for {session_id}")
+                logger.info("Closed ElevenLabs client for %s", session_id)
             except Exception as exc:
-                print(f"[SessionManager] Error closing ElevenLabs client: {exc}")
+                logger.warning("Error closing ElevenLabs client: %s", exc)
+
+        websocket = session.websocket
+        disconnected = WebSocketState.DISCONNECTED in (
+            getattr(websocket, "client_state", None),
+            getattr(websocket, "application_state", None),
+        )
+
+        # Deliver the finals still queued (pending partials are stale now);
+        # the drain task exits once the outbox is empty and the session is
+        # inactive, or is cancelled after _OUTBOX_CLOSE_TIMEOUT_SECS.
+        # Nothing can be delivered to a frontend that already disconnected.
+        outbox = session.outbox
+        if disconnected:
+            outbox.clear()
+        else:
+            finals = [item for item in outbox if item[0]]
+            outbox.clear()
+            outbox.extend(finals)
+        if session.outbox_task is not None:
+            if disconnected:
+                session.outbox_task.cancel()
+                await asyncio.gather(session.outbox_task, return_exceptions=True)
+            else:
+                self._wake_outbox(session)
+                try:
+                    await asyncio.wait_for(session.outbox_task, _OUTBOX_CLOSE_TIMEOUT_SECS)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Dropped %d final transcript(s) of %s on close", len(outbox), session_id
+                    )
+                except Exception as exc:
+                    logger.warning("Error flushing transcripts of %s: %s", session_id, exc)
+            session.outbox_task = None
+        outbox.clear()
 
         # Close WebSocket if still open
         try:
-            # Check if WebSocket is still connected
-            if hasattr(session.websocket, 'client_state'):
-                from fastapi.websockets import WebSocketState
-                if session.websocket.client_state != WebSocketState.DISCONNECTED:
-                    await session.websocket.close(code=1000, reason="Session closed normally")
-            else:
-                await session.websocket.close()
-            print(f"[SessionManager] Closed WebSocket for {session_id}")
+            if not disconnected:
+                await websocket.close(code=1000, reason="Session closed normally")
+            logger.info("Closed WebSocket for %s", session_id)
         except Exception as exc:
-            print(f"[SessionManager] WebSocket already closed or error: {exc}")
+            logger.warning("WebSocket already closed or error: %s", exc)
 
         # Finish run logging
         if self.run_logger is not None:
+            self._flush_audio_log(session)
             self.run_logger.finish_run(session_id)
 
         # Remove session from dictionary
         del self.sessions[session_id]
-        print(f"[SessionManager] Session {session_id} fully cleaned up")
+        logger.info("Session %s fully cleaned up", session_id)
 
     async def handle_text_message(self, session_id: str, text: str) -> None:
         """
@@ -179,25 +394,30 @@ class SessionManager:
         Supported message formats:
         1. "MODE:lecture" or "MODE:discussion"
            - Configures the transcription mode and connects to ElevenLabs
-        2. "STOP"
+        2. "RATE:48000"
+           - Declares the sample rate of the binary PCM that follows
+        3. "STOP"
            - Signals end of recording (currently just logged)
-        3. Other text
+        4. Other text
            - Simple echo for testing (can be removed in production)
         """
         session = self.sessions.get(session_id)
         if session is None or not session.is_active:
-            print(f"[SessionManager] Received text for invalid/inactive session {session_id}")
+            logger.warning("Received text for invalid/inactive session %s", session_id)
             return
 
         stripped = text.strip()
+        # Commands are matched on a bounded prefix, so long echo payloads
+        # are never upper-cased as a whole
+        head = stripped[:5].upper()
 
         # 1) MODE configuration
-        if stripped.upper().startswith("MODE:"):
-            mode_raw = stripped.split(":", 1)[1].strip().lower()
+        if head == "MODE:":
+            mode_raw = stripped[5:].strip().lower()
             mode = "lecture" if mode_raw != "discussion" else "discussion"
-            session.meta["mode"] = mode
+            session.mode = mode
 
-            print(f"[SessionManager] Setting mode to '{mode}' for session {session_id}")
+            logger.info("Setting mode to '%s' for session %s", mode, session_id)
 
             if self.run_logger is not None:
                 self.run_logger.log_event(
@@ -208,10 +428,9 @@ class SessionManager:
             # Create and connect ElevenLabs client if not already present
             if session.eleven_client is None:
                 if not self._api_key:
-                    error_msg = "[error] ELEVENLABS_API_KEY not configured"
-                    print(f"[SessionManager] {error_msg}")
+                    logger.error(_NO_API_KEY_REPLY)
                     try:
-                        await session.websocket.send_text(error_msg)
+                        await session.websocket.send_text(_NO_API_KEY_REPLY)
                     except Exception:
                         pass
                     return
@@ -221,15 +440,11 @@ class SessionManager:
                 eleven_client = ElevenLabsRealtimeClient(api_key=self._api_key, config=config)
 
                 # Bind callbacks to push transcripts to frontend
-                def handle_partial(text_: str) -> None:
-                    asyncio.create_task(
-                        self.push_transcript_to_client(session_id, text_, is_final=False)
-                    )
+                async def handle_partial(text_: str) -> None:
+                    await self.push_transcript_to_client(session_id, text_, is_final=False)
 
-                def handle_final(text_: str) -> None:
-                    asyncio.create_task(
-                        self.push_transcript_to_client(session_id, text_, is_final=True)
-                    )
+                async def handle_final(text_: str) -> None:
+                    await self.push_transcript_to_client(session_id, text_, is_final=True)
 
                 eleven_client.on_partial = handle_partial
                 eleven_client.on_final = handle_final
@@ -238,26 +453,21 @@ class SessionManager:
                 try:
                     await eleven_client.connect()
                     session.eleven_client = eleven_client
-                    success_msg = f"[config] mode set to {mode}, connected to ElevenLabs"
-                    print(f"[SessionManager] {success_msg}")
+                    logger.info(_MODE_CONNECTED_REPLIES[mode])
                     
                     try:
-                        await session.websocket.send_text(success_msg)
+                        await session.websocket.send_text(_MODE_CONNECTED_REPLIES[mode])
                     except Exception as exc:
-                        print(f"[SessionManager] Failed to send success message: {exc}")
+                        logger.error("Failed to send success message: %s", exc)
 
-                    # Start manual commit task if needed
+                    # Manual commits come from the shared sweeper
                     if config.commit_strategy == "manual":
-                        commit_interval = 12.0  # Optimal for presentations (from Experiment C)
-                        session.manual_commit_task = asyncio.create_task(
-                            self._manual_commit_loop(session_id, commit_interval)
-                        )
-                        print(f"[SessionManager] Started manual commit loop with {commit_interval}s interval")
+                        self._ensure_commit_sweeper()
 
                 except Exception as exc:
                     error_msg = f"[error] Failed to connect to ElevenLabs: {str(exc)}"
-                    print(f"[SessionManager] {error_msg}")
-                    session.meta["connection_error"] = str(exc)
+                    logger.error(error_msg)
+                    session.connection_error = str(exc)
                     
                     try:
                         await session.websocket.send_text(error_msg)
@@ -268,15 +478,42 @@ class SessionManager:
             else:
                 # Client already exists, just acknowledge
                 try:
-                    await session.websocket.send_text(f"[config] mode already set to {mode}")
+                    await session.websocket.send_text(_MODE_ALREADY_SET_REPLIES[mode])
                 except Exception as exc:
-                    print(f"[SessionManager] Failed to send acknowledgment: {exc}")
+                    logger.error("Failed to send acknowledgment: %s", exc)
 
             return
 
-        # 2) STOP signal
-        if stripped.upper() == "STOP":
-            print(f"[SessionManager] Received STOP signal from {session_id}")
+        # 2) Input sample rate declaration
+        if head == "RATE:":
+            try:
+                rate = int(stripped[5:])
+            except ValueError:
+                rate = 0
+
+            if not 8000 <= rate <= 48000:
+                try:
+                    await session.websocket.send_text(f"[error] Unsupported sample rate: {stripped}")
+                except Exception:
+                    pass
+                return
+
+            session.input_sample_rate = rate
+            session.resample_state = ResampleState()
+            logger.info("Input sample rate set to %s for session %s", rate, session_id)
+
+            if self.run_logger is not None:
+                self.run_logger.log_event(session_id, {"type": "rate_set", "rate": rate})
+
+            try:
+                await session.websocket.send_text(f"[config] input sample rate set to {rate}")
+            except Exception as exc:
+                logger.error("Failed to send acknowledgment: %s", exc)
+            return
+
+        # 3) STOP signal
+        if len(stripped) == 4 and head == "STOP":
+            logger.info("Received STOP signal from %s", session_id)
             if self.run_logger is not None:
                 self.run_logger.log_event(session_id, {"type": "stop_signal"})
             
@@ -284,19 +521,19 @@ class SessionManager:
             # (Currently not implemented in elevenlabs_client)
             
             try:
-                await session.websocket.send_text("[info] Recording stopped")
+                await session.websocket.send_text(_STOP_REPLY)
             except Exception as exc:
-                print(f"[SessionManager] Failed to send stop acknowledgment: {exc}")
+                logger.error("Failed to send stop acknowledgment: %s", exc)
             return
 
-        # 3) Other text: simple echo for testing
-        print(f"[SessionManager] Text from {session_id}: {text}")
+        # 4) Other text: simple echo for testing
+        logger.debug("Text from %s: %s", session_id, text)
         echo_text = f"Echo: {text}"
 
         try:
             await session.websocket.send_text(echo_text)
         except Exception as exc:
-            print(f"[SessionManager] Failed to send echo to {session_id}: {exc}")
+            logger.error("Failed to send echo to %s: %s", session_id, exc)
 
         if self.run_logger is not None:
             self.run_logger.log_event(
@@ -310,43 +547,73 @@ class SessionManager:
 
         Flow:
         1. Validate session exists and is active
-        2. Forward audio chunk to ElevenLabs client
-        3. Log the event for analysis
+        2. Resample to the ElevenLabs rate if the frontend declared another one
+        3. Forward audio chunk to ElevenLabs client
+        4. Log the event for analysis
         
-        Note: Audio should be 16kHz, mono, PCM format (converted in Swift app)
+        Note: Audio should be 16-bit mono PCM, 16kHz unless "RATE:" was sent
         """
         session = self.sessions.get(session_id)
         if session is None or not session.is_active:
-            print(f"[SessionManager] Received audio for invalid/inactive session {session_id}")
+            logger.warning("Received audio for invalid/inactive session %s", session_id)
             return
 
         # Check if ElevenLabs client is connected
         if session.eleven_client is None:
-            print(f"[SessionManager] Audio received but ElevenLabs client not initialized for {session_id}")
-            print("[SessionManager] Client should send MODE: first")
+            logger.warning("Audio received but ElevenLabs client not initialized for %s", session_id)
+            logger.warning("Client should send MODE: first")
             return
 
-        print(f"[SessionManager] Audio chunk from {session_id}: {len(data)} bytes")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Audio chunk from %s: %d bytes", session_id, len(data))
 
         # Forward to ElevenLabs
         try:
-            await session.eleven_client.send_audio_chunk(data)
+            # A view over Starlette's bytes: the client encodes from it directly
+            pcm = _prepare_pcm(
+                memoryview(data),
+                session.input_sample_rate,
+                session.eleven_client.config.sample_rate,
+                session.resample_state,
+            )
+            await session.eleven_client.send_audio_chunk(pcm)
         except Exception as exc:
             error_msg = f"Failed to send audio to ElevenLabs: {str(exc)}"
-            print(f"[SessionManager] {error_msg}")
+            logger.error(error_msg)
             
             # Notify client of error
             try:
-                await session.websocket.send_text(f"[error] {error_msg}")
+                await session.send_text(f"[error] {error_msg}")
             except Exception:
                 pass
 
-        # Log for analysis
-        if self.run_logger is not None:
-            self.run_logger.log_event(
-                session_id,
-                {"type": "audio_chunk", "size": len(data)}
+        # Log for analysis, batched into one event per _AUDIO_LOG_BATCH
+        # chunks or _AUDIO_LOG_MAX_AGE_SECS, whichever comes first
+        if session.log_event is not None:
+            now = time.monotonic()
+            buf = session.audio_log_buf
+            buf.append((now, len(data)))
+            if len(buf) >= _AUDIO_LOG_BATCH or now - buf[0][0] >= _AUDIO_LOG_MAX_AGE_SECS:
+                self._flush_audio_log(session)
+
+    def _flush_audio_log(self, session: Session) -> None:
+        """
+        Write the buffered audio chunks of a session as one event.
+        """
+        buf = session.audio_log_buf
+        if session.log_event is None or not buf:
+            return
+
+        t0 = buf[0][0]
+        session.log_event(
+            session.id,
+            AudioChunksEvent(
+                t0=t0,
+                offsets=[t - t0 for t, _ in buf],
+                sizes=[size for _, size in buf],
             )
+        )
+        session.audio_log_buf = []
 
     async def push_transcript_to_client(
         self,
@@ -361,6 +628,14 @@ class SessionManager:
 
         Message format: "[partial] text" or "[final] text"
         - Frontend can parse this to update current subtitle vs full transcript
+
+        Only queues the message on the session outbox, so a stalled frontend
+        never blocks the ElevenLabs dispatch loop. At most
+        _OUTBOX_MAX_PENDING messages are kept: when full, the oldest pending
+        partial is dropped (a newer partial or final supersedes it). Finals
+        are never dropped, and are still sent when the session closes.
+        The run log records transcripts once they have been sent, so it
+        reflects what the frontend actually received.
         
         Args:
         - session_id: Which session should receive the text.
@@ -369,65 +644,130 @@ class SessionManager:
         """
         session = self.sessions.get(session_id)
         if session is None or not session.is_active:
-            print(f"[SessionManager] Cannot push transcript, session {session_id} is invalid/inactive")
+            logger.warning("Cannot push transcript, session %s is invalid/inactive", session_id)
             return
 
-        msg_type = "final" if is_final else "partial"
-        payload = f"[{msg_type}] {text}"
+        outbox = session.outbox
+        if len(outbox) >= _OUTBOX_MAX_PENDING:
+            oldest_partial = next((i for i, (final, _) in enumerate(outbox) if not final), None)
+            if oldest_partial is not None:
+                del outbox[oldest_partial]
+                logger.warning("Frontend of %s is slow, dropped a pending partial", session_id)
+        outbox.append((is_final, text))
+
+        self._wake_outbox(session)
+        if session.outbox_task is None:
+            session.outbox_task = asyncio.create_task(self._drain_outbox(session))
+
+    @staticmethod
+    def _wake_outbox(session: Session) -> None:
+        waiter = session.outbox_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def _drain_outbox(self, session: Session) -> None:
+        """
+        Background task that sends the queued transcripts of one session.
 
-        try:
-            await session.websocket.send_text(payload)
-            print(f"[SessionManager] Pushed {msg_type} transcript to {session_id}: {text[:50]}...")
-        except Exception as exc:
-            print(f"[SessionManager] Failed to push transcript to {session_id}: {exc}")
+        Sleeps on a single Future while the outbox is empty, then sends
+        every queued message in order before waiting again. Returns once the
+        outbox is empty and the session has been closed.
+        """
+        loop = asyncio.get_running_loop()
+        outbox = session.outbox
+        send_text = session.send_text
 
-        if self.run_logger is not None:
-            self.run_logger.log_event(
-                session_id,
-                {"type": "transcript", "is_final": is_final, "text": text}
+        while True:
+            if not outbox:
+                if not session.is_active:
+                    return
+                session.outbox_waiter = loop.create_future()
+                try:
+                    await session.outbox_waiter
+                finally:
+                    session.outbox_waiter = None
+
+            while outbox:
+                is_final, text = outbox.popleft()
+                # Constant envelope prefix; only the transcript text varies
+                payload = _TRANSCRIPT_PREFIXES[is_final] + text
+                try:
+                    await send_text(payload)
+                    logger.debug("Pushed transcript to %s: %.60s...", session.id, payload)
+                except Exception as exc:
+                    logger.error("Failed to push transcript to %s: %s", session.id, exc)
+                    continue
+
+                if session.log_event is not None:
+                    session.log_event(session.id, TranscriptEvent(is_final=is_final, text=text))
+
+    def _ensure_commit_sweeper(self) -> None:
+        """
+        Schedule the shared manual commit sweep unless it is already pending.
+
+        Scheduled lazily from the event loop (the manager itself is created
+        before the loop runs); the sweep stops re-arming itself once no
+        session uses the manual commit strategy anymore.
+        """
+        if self._commit_timer is None:
+            self._commit_timer = asyncio.get_running_loop().call_later(
+                _MANUAL_COMMIT_INTERVAL_SECS, self._commit_sweep
+            )
+            logger.info(
+                "Started manual commit sweeper with %ss interval", _MANUAL_COMMIT_INTERVAL_SECS
             )
 
-    async def _manual_commit_loop(self, session_id: str, interval: float) -> None:
+    def _commit_sweep(self) -> None:
         """
-        Background task for manual commit strategy.
+        Timer callback for manual commit strategy.
 
         For discussion/presentation mode, automatically commits transcripts
-        at regular intervals (default 12s based on Experiment C).
+        at regular intervals (12s based on Experiment C). All sessions share
+        the interval, so one TimerHandle sweeps every active manual-commit
+        session per tick and then re-arms itself.
+        """
+        self._commit_timer = None
+
+        sessions = [
+            session for session in self.sessions.values()
+            if session.is_active
+            and session.eleven_client is not None
+            and session.eleven_client.config.commit_strategy == "manual"
+        ]
+        if not sessions:
+            logger.info("Manual commit sweeper: no manual-commit sessions left")
+            return
+
+        for session in sessions:
+            self._manual_commit(session)
 
-        This loop runs until the session is closed or the task is cancelled.
+        self._commit_timer = asyncio.get_running_loop().call_later(
+            _MANUAL_COMMIT_INTERVAL_SECS, self._commit_sweep
+        )
+
+    def _manual_commit(self, session: Session) -> None:
         """
-        print(f"[SessionManager] Manual commit loop started for {session_id} (interval={interval}s)")
-        
-        try:
-            while True:
-                await asyncio.sleep(interval)
-                
-                session = self.sessions.get(session_id)
-                if session is None or not session.is_active:
-                    print(f"[SessionManager] Manual commit loop: session {session_id} no longer active")
-                    break
-
-                if session.eleven_client is not None:
-                    try:
-                        # Send a commit signal to ElevenLabs
-                        # Note: This requires implementing send_commit() in elevenlabs_client.py
-                        # For now, we log it
-                        print(f"[SessionManager] Manual commit triggered for {session_id}")
-                        
-                        if self.run_logger is not None:
-                            self.run_logger.log_event(
-                                session_id,
-                                {"type": "manual_commit", "interval": interval}
-                            )
-                        
-                        # TODO: Implement actual commit sending
-                        # await session.eleven_client.send_commit()
-                        
-                    except Exception as exc:
-                        print(f"[SessionManager] Error in manual commit: {exc}")
+        Send a commit signal to ElevenLabs for one manual-commit session.
 
-        except asyncio.CancelledError:
-            print(f"[SessionManager] Manual commit loop cancelled for {session_id}")
-            raise
+        Runs from the sweep timer, so the send itself is a task, held on
+        the session until it finishes.
+        """
+        if session.commit_task is not None and not session.commit_task.done():
+            logger.warning("Previous manual commit for %s still in flight, skipping", session.id)
+            return
+
+        logger.info("Manual commit triggered for %s", session.id)
+
+        if self.run_logger is not None:
+            self.run_logger.log_event(
+                session.id,
+                {"type": "manual_commit", "interval": _MANUAL_COMMIT_INTERVAL_SECS}
+            )
+
+        session.commit_task = asyncio.create_task(self._send_commit(session))
+
+    async def _send_commit(self, session: Session) -> None:
+        try:
+            await session.eleven_client.send_commit()
         except Exception as exc:
-            print(f"[SessionManager] Unexpected error in manual commit loop: {exc}")
\ No newline at end of file
+            logger.error("Manual commit failed for %s: %s", session.id, exc)
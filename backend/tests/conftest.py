@@ -0,0 +1,47 @@
+# backend/tests/conftest.py
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# The backend modules import each other by bare name (run from backend/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import elevenlabs_client  # noqa: E402
+from elevenlabs_client import ElevenLabsRealtimeClient  # noqa: E402
+
+
+class RecordingWebSocket:
+    """Stand-in for the ElevenLabs socket that records outgoing frames."""
+
+    def __init__(self):
+        self.frames = []
+        self._closed = asyncio.Event()
+
+    async def send(self, message, text=False):
+        self.frames.append(message.encode() if isinstance(message, str) else bytes(message))
+
+    async def close(self):
+        self._closed.set()
+
+    async def __aiter__(self):
+        await self._closed.wait()
+        return
+        yield
+
+
+@pytest.fixture
+def fake_socket(monkeypatch):
+    sockets = []
+
+    async def connect(url, **kwargs):
+        sockets.append(RecordingWebSocket())
+        return sockets[-1]
+
+    async def token(self):
+        return "token"
+
+    monkeypatch.setattr(elevenlabs_client.websockets, "connect", connect)
+    monkeypatch.setattr(ElevenLabsRealtimeClient, "_fetch_single_use_token", token)
+    return sockets
@@ -0,0 +1,29 @@
+# backend/tests/test_audio_send.py
+import asyncio
+import base64
+import json
+
+from elevenlabs_client import ElevenLabsConfig, ElevenLabsRealtimeClient
+
+
+def _audio(frames):
+    return b"".join(base64.b64decode(json.loads(f)["audio_base_64"]) for f in frames)
+
+
+def test_each_chunk_is_sent_as_one_message(fake_socket):
+    chunks = [bytes([i]) * 640 for i in range(5)]
+
+    async def main():
+        client = ElevenLabsRealtimeClient(api_key="key", config=ElevenLabsConfig())
+        await client.connect()
+        for chunk in chunks:
+            await client.send_audio_chunk(memoryview(chunk))
+        # Sent right away, one message per chunk
+        frames = list(fake_socket[0].frames)
+        await client.close()
+        return frames
+
+    frames = asyncio.run(main())
+
+    assert len(frames) == len(chunks)
+    assert _audio(frames) == b"".join(chunks)
@@ -0,0 +1,74 @@
+# backend/tests/test_elevenlabs_client.py
+import asyncio
+
+from elevenlabs_client import ElevenLabsConfig, ElevenLabsRealtimeClient
+
+
+def _dispatch(frames):
+    """Run the dispatch loop over the given raw frames, return the transcripts."""
+    async def main():
+        client = ElevenLabsRealtimeClient(api_key="key", config=ElevenLabsConfig())
+        received = []
+
+        async def on_partial(text):
+            received.append(("partial", text))
+
+        async def on_final(text):
+            received.append(("final", text))
+
+        client.on_partial = on_partial
+        client.on_final = on_final
+        client._inbox.extend(frames)
+        client._inbox.append(None)
+        await client._dispatch_loop()
+        return received
+
+    return asyncio.run(main())
+
+
+def test_dispatch_survives_malformed_frames():
+    received = _dispatch([
+        "[1,2,3]",
+        '"just a string"',
+        "42",
+        '{"message_type": 7}',
+        '{"message_type": ["partial_transcript"]}',
+        "not json",
+        '{"message_type": "committed_transcript", "text": "still here"}',
+    ])
+
+    assert received == [("final", "still here")]
+
+
+def test_dispatch_handles_typed_and_aliased_messages():
+    received = _dispatch([
+        '{"message_type": "session_started", "session_id": "s1"}',
+        '{"message_type": "partial_transcript", "text": "hel"}',
+        '{"message_type": "partialTranscript", "text": "hello"}',
+        '{"message_type": "auth_error", "error": "boom"}',
+        '{"message_type": "committedTranscriptWithTimestamps", "text": "hello world"}',
+    ])
+
+    assert received == [("partial", "hel"), ("partial", "hello"), ("final", "hello world")]
+
+
+def test_dispatch_survives_failing_callback():
+    async def main():
+        client = ElevenLabsRealtimeClient(api_key="key", config=ElevenLabsConfig())
+        received = []
+
+        async def on_final(text):
+            if text == "bad":
+                raise RuntimeError("frontend gone")
+            received.append(text)
+
+        client.on_final = on_final
+        client._inbox.extend([
+            '{"message_type": "committed_transcript", "text": "bad"}',
+            '{"message_type": "committed_transcript", "text": "good"}',
+            None,
+        ])
+        await client._dispatch_loop()
+        return received
+
+    assert asyncio.run(main()) == ["good"]
@@ -0,0 +1,30 @@
+# backend/tests/test_logging_setup.py
+import logging
+import threading
+
+from logging_setup import setup_logging
+
+
+def test_records_are_formatted_on_the_listener_thread():
+    formatted_on = []
+
+    class Probe:
+        def __str__(self):
+            formatted_on.append(threading.current_thread())
+            return "probe"
+
+    rt_logger = logging.getLogger("rt")
+    handlers = list(rt_logger.handlers)
+    level, propagate = rt_logger.level, rt_logger.propagate
+    listener = setup_logging(logging.INFO)
+    try:
+        logging.getLogger("rt.test").info("value: %s", Probe())
+    finally:
+        listener.stop()
+        for handler in rt_logger.handlers[len(handlers):]:
+            rt_logger.removeHandler(handler)
+        rt_logger.setLevel(level)
+        rt_logger.propagate = propagate
+
+    assert formatted_on
+    assert threading.current_thread() not in formatted_on
@@ -0,0 +1,65 @@
+# backend/tests/test_resample.py
+import math
+
+import numpy as np
+import pytest
+
+import session_manager
+from session_manager import ResampleState, _prepare_pcm
+
+
+def _tone(n, sr, freq=440.0):
+    t = np.arange(n) / sr
+    return np.rint(10000 * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+
+
+def _feed(pcm: bytes, cuts, src_sr, dst_sr):
+    state = ResampleState()
+    out = []
+    start = 0
+    for end in list(cuts) + [len(pcm)]:
+        out.append(bytes(_prepare_pcm(memoryview(pcm[start:end]), src_sr, dst_sr, state)))
+        start = end
+    return np.frombuffer(b"".join(out), dtype=np.int16)
+
+
+@pytest.mark.parametrize("src_sr", [48000, 44100, 8000])
+def test_chunked_resampling_matches_one_shot(src_sr):
+    pcm = _tone(src_sr, src_sr).tobytes()  # 1 second
+    whole = _feed(pcm, [], src_sr, 16000)
+    chunked = _feed(pcm, range(2000, len(pcm), 2000), src_sr, 16000)
+
+    # No per-chunk rounding loss: 1 s in gives 1 s out, minus the output
+    # samples that still wait for the input sample after the last one
+    assert 16000 - math.ceil(16000 / src_sr) - 1 <= len(chunked) <= 16000
+    np.testing.assert_array_equal(chunked, whole)
+
+
+def test_chunk_boundaries_are_continuous():
+    pcm = _tone(48000, 48000).tobytes()
+    out = _feed(pcm, range(2000, len(pcm), 2000), 48000, 16000).astype(np.int32)
+    expected = _tone(len(out), 16000).astype(np.int32)
+
+    # Linear interpolation of a 440 Hz tone stays within a few LSB of it
+    assert np.max(np.abs(out - expected)) <= 2
+
+
+def test_odd_byte_is_carried_into_next_chunk():
+    pcm = _tone(4800, 48000).tobytes()
+    odd_cuts = range(1001, len(pcm), 1001)
+
+    np.testing.assert_array_equal(
+        _feed(pcm, odd_cuts, 48000, 16000), _feed(pcm, [], 48000, 16000)
+    )
+    # Same rate: passed through, but still realigned to whole samples
+    assert _feed(pcm, odd_cuts, 16000, 16000).tobytes() == pcm
+
+
+def test_numpy_fallback_matches_kernel(monkeypatch):
+    pcm = _tone(4800, 48000).tobytes()
+    cuts = range(999, len(pcm), 999)
+    expected = _feed(pcm, cuts, 48000, 16000)
+
+    monkeypatch.setattr(session_manager, "_resample", session_manager._resample_numpy)
+
+    np.testing.assert_array_equal(_feed(pcm, cuts, 48000, 16000), expected)
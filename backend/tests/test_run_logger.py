@@ -0,0 +1,72 @@
+# backend/tests/test_run_logger.py
+import msgspec
+import pytest
+
+from run_logger import AudioChunksEvent, RunLogger, TranscriptEvent, iter_run_events
+
+
+def _write_run(base_dir, session_id="s1"):
+    run_logger = RunLogger(base_dir)
+    run_logger.start_run(session_id, meta={"status": "created"})
+    run_logger.log_event(session_id, {"type": "mode_set", "mode": "lecture"})
+    run_logger.log_event(session_id, TranscriptEvent(is_final=False, text="héllo"))
+    run_logger.log_event(
+        session_id, AudioChunksEvent(t0=12.5, offsets=[0.0, 0.02], sizes=[6400, 6400])
+    )
+    run_logger.log_event(session_id, TranscriptEvent(is_final=True, text="hello world"))
+    run_logger.finish_run(session_id)
+    run_logger.close()
+    return base_dir / f"{session_id}.mpk"
+
+
+EXPECTED = [
+    {"type": "run_started", "meta": {"status": "created"}},
+    {"type": "mode_set", "mode": "lecture"},
+    {"type": "transcript", "is_final": False, "text": "héllo"},
+    {"type": "audio_chunks", "t0": 12.5, "offsets": [0.0, 0.02], "sizes": [6400, 6400]},
+    {"type": "transcript", "is_final": True, "text": "hello world"},
+    {"type": "run_finished"},
+]
+
+
+def test_round_trip(tmp_path):
+    path = _write_run(tmp_path)
+
+    assert list(iter_run_events(path)) == EXPECTED
+
+
+def test_events_for_unknown_or_finished_runs_are_ignored(tmp_path):
+    run_logger = RunLogger(tmp_path)
+    run_logger.log_event("missing", {"type": "ignored"})
+    run_logger.start_run("s1")
+    run_logger.finish_run("s1")
+    run_logger.log_event("s1", {"type": "late"})
+    run_logger.close()
+    run_logger.close()  # safe to call twice
+
+    assert not (tmp_path / "missing.mpk").exists()
+    assert [e["type"] for e in iter_run_events(tmp_path / "s1.mpk")] == [
+        "run_started", "run_finished"
+    ]
+
+
+def test_close_flushes_open_runs(tmp_path):
+    run_logger = RunLogger(tmp_path)
+    run_logger.start_run("s1")
+    run_logger.log_event("s1", {"type": "mode_set", "mode": "discussion"})
+    run_logger.close()
+
+    assert [e["type"] for e in iter_run_events(tmp_path / "s1.mpk")] == [
+        "run_started", "mode_set"
+    ]
+
+
+@pytest.mark.parametrize("cut", [1, 3, 4, 5])
+def test_truncated_final_record_is_skipped(tmp_path, cut):
+    path = _write_run(tmp_path)
+    data = path.read_bytes()
+    # Drop the tail of the run_finished record (or all but part of its header)
+    last_record = 4 + len(msgspec.msgpack.encode({"type": "run_finished"}))
+    path.write_bytes(data[:len(data) - last_record + cut])
+
+    assert list(iter_run_events(path)) == EXPECTED[:-1]
@@ -0,0 +1,190 @@
+# backend/tests/test_session_manager.py
+import asyncio
+import json
+
+from fastapi.websockets import WebSocketState
+
+import session_manager
+from run_logger import RunLogger, iter_run_events
+from session_manager import SessionManager
+
+
+class StalledWebSocket:
+    """Frontend stand-in whose sends block until release() is called."""
+
+    client_state = None
+
+    def __init__(self):
+        self.sent = []
+        self._gate = asyncio.Event()
+
+    def release(self):
+        self._gate.set()
+
+    async def send_text(self, text):
+        await self._gate.wait()
+        self.sent.append(text)
+
+    async def close(self, code=1000, reason=None):
+        pass
+
+
+class FrontendWebSocket:
+    """Frontend stand-in that records what it is sent."""
+
+    client_state = None
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(text)
+
+    async def close(self, code=1000, reason=None):
+        pass
+
+
+def test_commit_sweep_sends_commits_for_discussion_sessions(fake_socket, monkeypatch):
+    monkeypatch.setattr(session_manager, "_MANUAL_COMMIT_INTERVAL_SECS", 0.05)
+
+    async def main():
+        manager = SessionManager(run_logger=None, api_key="key")
+        discussion = await manager.create_session(FrontendWebSocket())
+        lecture = await manager.create_session(FrontendWebSocket())
+        await manager.handle_text_message(discussion.id, "MODE:discussion")
+        await manager.handle_text_message(lecture.id, "MODE:lecture")
+
+        for session in (discussion, lecture):
+            await manager.handle_binary_audio(session.id, b"\x01\x00" * 320)
+        await asyncio.sleep(0.12)
+
+        for session in (discussion, lecture):
+            await manager.close_session(session.id)
+        return [[json.loads(f) for f in ws.frames] for ws in fake_socket]
+
+    discussion_frames, lecture_frames = asyncio.run(main())
+
+    commits = [f for f in discussion_frames if f["commit"]]
+    # Audio was only sent before the first sweep, so only it is committed
+    assert len(commits) == 1
+    assert not any(f["commit"] for f in lecture_frames)
+
+
+def test_outbox_drops_oldest_partials_and_keeps_finals(tmp_path):
+    async def main():
+        manager = SessionManager(run_logger=RunLogger(tmp_path), api_key="key")
+        ws = StalledWebSocket()
+        session = await manager.create_session(ws)
+
+        for i in range(40):
+            await manager.push_transcript_to_client(session.id, f"p{i}", is_final=False)
+            if i % 10 == 9:
+                await manager.push_transcript_to_client(session.id, f"f{i}", is_final=True)
+
+        assert len(session.outbox) <= session_manager._OUTBOX_MAX_PENDING
+        ws.release()
+        while session.outbox:
+            await asyncio.sleep(0.01)
+        await manager.close_session(session.id)
+        manager.run_logger.close()
+        return ws.sent, session.id
+
+    sent, session_id = asyncio.run(main())
+
+    assert [m for m in sent if m.startswith("[final] ")] == [
+        "[final] f9", "[final] f19", "[final] f29", "[final] f39"
+    ]
+    assert "[partial] p39" in sent
+    assert "[partial] p0" not in sent
+
+    # Only what reached the frontend is in the run log
+    logged = [
+        ("[final] " if e["is_final"] else "[partial] ") + e["text"]
+        for e in iter_run_events(tmp_path / f"{session_id}.mpk")
+        if e["type"] == "transcript"
+    ]
+    assert logged == sent
+
+
+def test_close_session_sends_pending_finals(tmp_path):
+    async def main():
+        manager = SessionManager(run_logger=None, api_key="key")
+        ws = StalledWebSocket()
+        session = await manager.create_session(ws)
+
+        await manager.push_transcript_to_client(session.id, "a", is_final=False)
+        await manager.push_transcript_to_client(session.id, "b", is_final=True)
+        await manager.push_transcript_to_client(session.id, "c", is_final=False)
+        await manager.push_transcript_to_client(session.id, "d", is_final=True)
+
+        # The frontend catches up while the session is closing
+        asyncio.get_running_loop().call_later(0.05, ws.release)
+        await manager.close_session(session.id)
+        return ws.sent, session
+
+    sent, session = asyncio.run(main())
+
+    assert [m for m in sent if m.startswith("[final] ")] == ["[final] b", "[final] d"]
+    assert "[partial] c" not in sent
+    assert session.outbox_task is None
+
+
+def test_close_session_gives_up_on_stalled_frontend(monkeypatch):
+    monkeypatch.setattr(session_manager, "_OUTBOX_CLOSE_TIMEOUT_SECS", 0.05)
+
+    async def main():
+        manager = SessionManager(run_logger=None, api_key="key")
+        session = await manager.create_session(StalledWebSocket())
+        await manager.push_transcript_to_client(session.id, "final", is_final=True)
+        await manager.close_session(session.id)
+        return manager, session
+
+    manager, session = asyncio.run(main())
+
+    assert session.id not in manager.sessions
+    assert not session.outbox
+
+
+def test_audio_chunk_that_fails_to_resample_is_dropped(fake_socket, monkeypatch):
+    def broken_resample(*args):
+        raise ValueError("bad chunk")
+
+    monkeypatch.setattr(session_manager, "_resample", broken_resample)
+
+    async def main():
+        manager = SessionManager(run_logger=None, api_key="key")
+        ws = FrontendWebSocket()
+        session = await manager.create_session(ws)
+        await manager.handle_text_message(session.id, "MODE:lecture")
+        await manager.handle_text_message(session.id, "RATE:48000")
+
+        await manager.handle_binary_audio(session.id, b"\x01\x00" * 480)
+        await manager.close_session(session.id)
+        return ws.sent
+
+    sent = asyncio.run(main())
+
+    assert not fake_socket[0].frames
+    assert any(m.startswith("[error] ") for m in sent)
+
+
+def test_close_session_skips_finals_for_disconnected_frontend():
+    async def main():
+        manager = SessionManager(run_logger=None, api_key="key")
+        ws = StalledWebSocket()
+        session = await manager.create_session(ws)
+        await manager.push_transcript_to_client(session.id, "final", is_final=True)
+
+        ws.client_state = WebSocketState.DISCONNECTED
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await manager.close_session(session.id)
+        return ws.sent, session, loop.time() - started
+
+    sent, session, elapsed = asyncio.run(main())
+
+    assert sent == []
+    assert not session.outbox
+    assert session.outbox_task is None
+    # Did not wait out _OUTBOX_CLOSE_TIMEOUT_SECS on the dead socket
+    assert elapsed < 0.5